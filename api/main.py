@@ -6,21 +6,71 @@ REST API endpoints for content management, search, and folder operations.
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from typing import List, Optional
+from contextlib import asynccontextmanager
 import uvicorn
+import asyncio
+import logging
 import os
+import threading
 
 from core.content_manager import ContentManager
 from core.search_engine import SearchEngine
 
+logger = logging.getLogger(__name__)
+
+# Initialize content manager with search engine
+search_engine = SearchEngine(cache_capacity=100)
+content_manager = ContentManager(search_engine)
+
+# Data endpoints are plain `def` so Starlette runs them in its threadpool and
+# CPU-bound indexing/search never blocks the event loop. The index is not
+# thread-safe, so every content_manager call goes through this lock.
+content_lock = threading.Lock()
+
+# Document accesses are queued by the search engine and applied in batches
+ACCESS_FLUSH_INTERVAL = 0.2  # seconds
+
+
+def _flush_access_log():
+    with content_lock:
+        search_engine.flush_access_log()
+
+
+async def _access_log_flusher():
+    """Periodically apply queued document accesses to the search engine"""
+    while True:
+        await asyncio.sleep(ACCESS_FLUSH_INTERVAL)
+        if not search_engine.has_pending_accesses():
+            continue
+        try:
+            await run_in_threadpool(_flush_access_log)
+        except Exception:
+            # Keep flushing on later ticks instead of letting the task die
+            logger.exception("Failed to flush the document access log")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the access-log flusher for the lifetime of the app"""
+    flusher = asyncio.create_task(_access_log_flusher())
+    try:
+        yield
+    finally:
+        flusher.cancel()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Personal Smart Search & Organizer API",
     description="A production-ready search and organization system with advanced DSA",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Enable CORS for frontend
@@ -32,9 +82,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize content manager with search engine
-search_engine = SearchEngine(cache_capacity=100)
-content_manager = ContentManager(search_engine)
+# Compress larger JSON payloads (search results, document/folder listings)
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
 
 # Serve static files (frontend)
 frontend_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'frontend')
@@ -66,7 +115,7 @@ if os.path.exists(frontend_path):
         raise HTTPException(status_code=404, detail="JS file not found")
 
 
-# Pydantic models for request/response
+# Pydantic (v2, Rust-backed validation) models for request/response
 class DocumentCreate(BaseModel):
     title: str
     body: str
@@ -94,6 +143,64 @@ class AutocompleteRequest(BaseModel):
     limit: int = 10
 
 
+# Response models: with a return type set, FastAPI serializes the response
+# straight to JSON bytes through Pydantic's Rust core
+class Document(BaseModel):
+    id: str
+    title: str
+    body: str
+    tags: List[str]
+    created_at: str
+    last_accessed: str
+    folder_path: str
+
+
+class SearchResult(BaseModel):
+    id: str
+    title: str
+    body: str
+    tags: List[str]
+    relevance_score: float
+
+
+class FolderInfo(BaseModel):
+    path: str
+    name: str
+    document_count: int
+    children_count: int
+
+
+class DocumentResponse(BaseModel):
+    success: bool
+    document: Document
+
+
+class DocumentListResponse(BaseModel):
+    success: bool
+    documents: List[Document]
+    count: int
+
+
+class FolderListResponse(BaseModel):
+    success: bool
+    folders: List[FolderInfo]
+    count: int
+
+
+class SearchResponse(BaseModel):
+    success: bool
+    query: str
+    results: List[SearchResult]
+    count: int
+
+
+class AutocompleteResponse(BaseModel):
+    success: bool
+    prefix: str
+    suggestions: List[str]
+    count: int
+
+
 # Health check (moved to /health since / serves frontend)
 @app.get("/api")
 async def api_root():
@@ -112,168 +219,194 @@ async def health():
 
 
 # Document endpoints
-@app.post("/api/documents", response_model=dict)
-async def create_document(doc: DocumentCreate):
+@app.post("/api/documents")
+def create_document(doc: DocumentCreate) -> DocumentResponse:
     """
     Create a new document.
     
     Time Complexity: O(n) where n is number of words in document
     """
     try:
-        document = content_manager.add_document(
-            title=doc.title,
-            body=doc.body,
-            tags=doc.tags,
-            folder_path=doc.folder_path
-        )
-        return {"success": True, "document": document}
+        with content_lock:
+            document = content_manager.add_document(
+                title=doc.title,
+                body=doc.body,
+                tags=doc.tags,
+                folder_path=doc.folder_path
+            )
+        return DocumentResponse(success=True, document=document)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/api/documents/{document_id}", response_model=dict)
-async def get_document(document_id: str):
+@app.get("/api/documents/{document_id}")
+def get_document(document_id: str) -> DocumentResponse:
     """
     Get a document by ID.
     
     Time Complexity: O(1)
     """
-    document = content_manager.get_document(document_id)
-    if not document:
-        raise HTTPException(status_code=404, detail="Document not found")
-    return {"success": True, "document": document}
+    with content_lock:
+        document = content_manager.get_document(document_id)
+        if not document:
+            raise HTTPException(status_code=404, detail="Document not found")
+        # Build the response while holding the lock; the document is the
+        # stored object and validation copies it into the model
+        return DocumentResponse(success=True, document=document)
 
 
-@app.put("/api/documents/{document_id}", response_model=dict)
-async def update_document(document_id: str, doc: DocumentUpdate):
+@app.put("/api/documents/{document_id}")
+def update_document(document_id: str, doc: DocumentUpdate) -> DocumentResponse:
     """
     Update a document.
     
     Time Complexity: O(n) where n is number of words in document
     """
-    document = content_manager.update_document(
-        document_id=document_id,
-        title=doc.title,
-        body=doc.body,
-        tags=doc.tags
-    )
+    with content_lock:
+        document = content_manager.update_document(
+            document_id=document_id,
+            title=doc.title,
+            body=doc.body,
+            tags=doc.tags
+        )
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
-    return {"success": True, "document": document}
+    return DocumentResponse(success=True, document=document)
 
 
-@app.delete("/api/documents/{document_id}", response_model=dict)
-async def delete_document(document_id: str):
+@app.delete("/api/documents/{document_id}")
+def delete_document(document_id: str):
     """
     Delete a document.
     
     Time Complexity: O(1)
     """
-    success = content_manager.delete_document(document_id)
+    with content_lock:
+        success = content_manager.delete_document(document_id)
     if not success:
         raise HTTPException(status_code=404, detail="Document not found")
     return {"success": True, "message": "Document deleted"}
 
 
-@app.get("/api/documents", response_model=dict)
-async def list_documents(folder_path: Optional[str] = None):
+@app.get("/api/documents")
+def list_documents(folder_path: Optional[str] = None) -> DocumentListResponse:
     """
     List all documents, optionally filtered by folder.
     
     Time Complexity: O(d) where d is number of documents
     """
-    documents = content_manager.list_documents(folder_path)
-    return {"success": True, "documents": documents, "count": len(documents)}
+    with content_lock:
+        documents = content_manager.list_documents(folder_path)
+        # Build the response while holding the lock; the documents are the
+        # stored objects and validation copies them into the model
+        return DocumentListResponse(success=True, documents=documents, count=len(documents))
 
 
-@app.post("/api/documents/{document_id}/move", response_model=dict)
-async def move_document(document_id: str, move: DocumentMove):
+@app.post("/api/documents/{document_id}/move")
+def move_document(document_id: str, move: DocumentMove):
     """
     Move a document to a different folder.
     
     Time Complexity: O(1)
     """
-    success = content_manager.move_document(document_id, move.new_folder_path)
+    with content_lock:
+        success = content_manager.move_document(document_id, move.new_folder_path)
     if not success:
         raise HTTPException(status_code=404, detail="Document not found")
     return {"success": True, "message": "Document moved"}
 
 
 # Folder endpoints
-@app.post("/api/folders", response_model=dict)
-async def create_folder(path: str):
+@app.post("/api/folders")
+def create_folder(path: str):
     """
     Create a folder.
     
     Time Complexity: O(h) where h is depth of path
     """
-    success = content_manager.create_folder(path)
+    with content_lock:
+        success = content_manager.create_folder(path)
     return {"success": True, "message": "Folder created"}
 
 
-@app.delete("/api/folders", response_model=dict)
-async def delete_folder(path: str):
+@app.delete("/api/folders")
+def delete_folder(path: str):
     """
     Delete a folder.
     
     Time Complexity: O(h + n) where h is depth, n is number of descendants
     """
-    success = content_manager.delete_folder(path)
+    with content_lock:
+        success = content_manager.delete_folder(path)
     if not success:
         raise HTTPException(status_code=404, detail="Folder not found")
     return {"success": True, "message": "Folder deleted"}
 
 
-@app.get("/api/folders", response_model=dict)
-async def list_folders():
+@app.get("/api/folders")
+def list_folders() -> FolderListResponse:
     """
     List all folders.
     
     Time Complexity: O(n) where n is number of folders
     """
-    folders = content_manager.list_folders()
-    return {"success": True, "folders": folders, "count": len(folders)}
+    with content_lock:
+        folders = content_manager.list_folders()
+    return FolderListResponse(success=True, folders=folders, count=len(folders))
 
 
 # Search endpoints
-@app.post("/api/search", response_model=dict)
-async def search(request: SearchRequest):
+@app.post("/api/search")
+def search(request: SearchRequest) -> SearchResponse:
     """
     Search for documents.
     
-    Time Complexity: O(k * log(k)) where k is number of matching documents
+    Time Complexity: O(k * log(t)) where k is number of matching documents, t is top_k
     """
-    results = content_manager.search(request.query, request.top_k)
-    return {
-        "success": True,
-        "query": request.query,
-        "results": results,
-        "count": len(results)
-    }
+    with content_lock:
+        results = content_manager.search(request.query, request.top_k)
+    return SearchResponse(
+        success=True,
+        query=request.query,
+        results=results,
+        count=len(results)
+    )
 
 
-@app.post("/api/autocomplete", response_model=dict)
-async def autocomplete(request: AutocompleteRequest):
+@app.post("/api/autocomplete")
+def autocomplete(request: AutocompleteRequest) -> AutocompleteResponse:
     """
     Get autocomplete suggestions.
     
     Time Complexity: O(m + s) where m is prefix length, s is number of suggestions
     """
-    suggestions = content_manager.autocomplete(request.prefix, request.limit)
-    return {
-        "success": True,
-        "prefix": request.prefix,
-        "suggestions": suggestions,
-        "count": len(suggestions)
-    }
+    with content_lock:
+        suggestions = content_manager.autocomplete(request.prefix, request.limit)
+    return AutocompleteResponse(
+        success=True,
+        prefix=request.prefix,
+        suggestions=suggestions,
+        count=len(suggestions)
+    )
 
 
-@app.post("/api/cache/clear", response_model=dict)
-async def clear_cache():
+@app.post("/api/cache/clear")
+def clear_cache():
     """Clear the search cache"""
-    content_manager.search_engine.clear_cache()
+    with content_lock:
+        content_manager.search_engine.clear_cache()
     return {"success": True, "message": "Cache cleared"}
 
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop/httptools are requested explicitly so a missing uvicorn[standard]
+    # install fails loudly instead of silently falling back to asyncio/h11
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+        log_level="warning"
+    )
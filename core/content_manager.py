@@ -84,7 +84,10 @@ class ContentManager:
     
     def get_document(self, document_id: str) -> Optional[Dict]:
         """
-        Get a document by ID.
+        Open a document by ID, updating its last-accessed time.
+        
+        The stored dictionary is returned as-is (no copy); callers must not
+        mutate it.
         
         Args:
             document_id: Document ID
@@ -94,14 +97,12 @@ class ContentManager:
         
         Time Complexity: O(1)
         """
-        if document_id not in self.documents:
+        doc = self.documents.get(document_id)
+        if doc is None:
             return None
         
-        doc = self.documents[document_id].copy()
-        
         # Update last accessed
         doc["last_accessed"] = datetime.now().isoformat()
-        self.documents[document_id]["last_accessed"] = doc["last_accessed"]
         
         # Record access in search engine
         self.search_engine.record_access(document_id)
@@ -211,13 +212,14 @@ class ContentManager:
             folder_path: Optional folder path to filter by
         
         Returns:
-            List of document dictionaries
+            List of document dictionaries (stored objects, not copies; callers
+            must not mutate them)
         """
         if folder_path is None:
-            return [doc.copy() for doc in self.documents.values()]
+            return list(self.documents.values())
         
         doc_ids = self.folder_tree.get_documents_in_folder(folder_path)
-        return [self.documents[doc_id].copy() for doc_id in doc_ids if doc_id in self.documents]
+        return [self.documents[doc_id] for doc_id in doc_ids if doc_id in self.documents]
     
     def create_folder(self, path: str) -> bool:
         """
@@ -248,7 +250,7 @@ class ContentManager:
         
         # Move documents to parent folder
         doc_ids = folder.document_ids.copy()
-        parent_path = folder.parent.get_path() if folder.parent else "/"
+        parent_path = folder.parent.path if folder.parent else "/"
         
         for doc_id in doc_ids:
             self.move_document(doc_id, parent_path)
@@ -5,7 +5,7 @@ Uses Trie for autocomplete, HashMap for keyword indexing, and Priority Queue for
 
 Time Complexity:
 - Index document: O(n) where n is number of words in document
-- Search: O(k * log(k)) where k is number of matching documents
+- Search: O(k * log(t)) where k is number of matching documents, t is top_k
 - Autocomplete: O(m + s) where m is prefix length, s is number of suggestions
 
 Space Complexity: O(V + D) where V is vocabulary size, D is number of documents
@@ -13,14 +13,44 @@ Space Complexity: O(V + D) where V is vocabulary size, D is number of documents
 
 import re
 import heapq
-from typing import List, Dict, Set, Tuple, Optional
-from datetime import datetime, timedelta
-from collections import defaultdict
+import queue
+import time
+from array import array
+from bisect import bisect_left
+from typing import List, Dict, Set, Tuple, Optional, Deque
+from collections import defaultdict, deque
 
 from data_structures.trie import Trie
 from data_structures.lru_cache import LRUCache
 
 
+# Tokenizer patterns compiled once at import. ASCII text (the common case) takes
+# the ASCII-only matcher; anything else falls back to the Unicode-aware pattern
+# so non-English words are still tokenized. str.lower() already has an ASCII
+# fast path in CPython, and one lower() over the text measured faster than a
+# translate table or lowercasing each token after matching.
+_TOKEN_RE = re.compile(r'\w+')
+_ASCII_TOKEN_RE = re.compile(r'\w+', re.ASCII)
+
+# Shared empty posting list for keywords missing from the index
+_EMPTY_SET: frozenset = frozenset()
+
+# Autocomplete prefixes up to this length are served from a cache, since they
+# match the largest Trie subtrees
+_SHORT_PREFIX_LEN = 2
+
+# Relevance weights (see _score_documents) and the access count at which the
+# usage factor saturates at 1.0
+_TF_WEIGHT = 0.5
+_RECENCY_WEIGHT = 0.3
+_USAGE_WEIGHT = 0.2
+_USAGE_SATURATION = 10.0
+
+# Pending access events are applied inline once this many have queued up, so
+# the queue stays bounded even when nothing calls flush_access_log()
+_ACCESS_QUEUE_FLUSH_SIZE = 1000
+
+
 class SearchEngine:
     """Core search engine with tokenization, indexing, and ranking"""
     
@@ -34,20 +64,46 @@ class SearchEngine:
         # Trie for autocomplete
         self.trie = Trie()
         
-        # HashMap: keyword -> set of document IDs containing this keyword
-        self.keyword_index: Dict[str, Set[str]] = defaultdict(set)
+        # Token interning: every distinct keyword gets a stable integer ID
+        self.token_to_id: Dict[str, int] = {}
+        self.id_to_token: List[str] = []
+        
+        # HashMap: keyword ID -> set of document IDs containing this keyword
+        self.keyword_index: Dict[int, Set[str]] = defaultdict(set)
         
         # HashMap: document_id -> document metadata
         self.documents: Dict[str, Dict] = {}
         
-        # HashMap: document_id -> keyword frequency map
-        self.document_keyword_freq: Dict[str, Dict[str, int]] = defaultdict(dict)
+        # Per-document keyword frequencies as parallel compact arrays:
+        # document_id -> sorted keyword IDs, and document_id -> their counts
+        self.document_token_ids: Dict[str, array] = {}
+        self.document_token_freqs: Dict[str, array] = {}
+        
+        # HashMap: document_id -> total number of indexed words
+        self.document_total_words: Dict[str, int] = {}
         
         # LRU Cache for search results
         self.search_cache = LRUCache(cache_capacity)
         
-        # HashMap: document_id -> access history (list of timestamps)
-        self.access_history: Dict[str, List[datetime]] = defaultdict(list)
+        # Bumped on every index mutation and included in cache keys, so stale
+        # cached results become unreachable and age out of the LRU
+        self._index_version = 0
+        
+        # LRU Cache: (index version, canonical keywords) -> (top ranked [(score, doc_id), ...], exhaustive)
+        self._ranked_cache = LRUCache(cache_capacity)
+        
+        # HashMap: short prefix -> (limit used, autocomplete suggestions).
+        # Only prefixes of indexed words are stored, so the size is bounded by
+        # the vocabulary rather than by what clients send
+        self._short_prefix_cache: Dict[str, Tuple[int, List[str]]] = {}
+        
+        # HashMap: document_id -> access history (ring buffer of the last 100
+        # access times as epoch seconds)
+        self.access_history: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=100))
+        
+        # Queue of (document_id, timestamp) access events not yet applied to
+        # access_history; drained by flush_access_log()
+        self._access_queue: queue.SimpleQueue = queue.SimpleQueue()
     
     def _tokenize(self, text: str) -> List[str]:
         """
@@ -63,50 +119,22 @@ class SearchEngine:
             return []
         
         # Extract words (alphanumeric sequences)
-        words = re.findall(r'\b\w+\b', text.lower())
-        return words
+        if text.isascii():
+            return _ASCII_TOKEN_RE.findall(text.lower())
+        return _TOKEN_RE.findall(text.lower())
     
-    def _calculate_tf(self, keyword: str, document_id: str) -> float:
-        """
-        Calculate Term Frequency (TF) for a keyword in a document.
-        
-        Args:
-            keyword: The keyword
-            document_id: The document ID
-        
-        Returns:
-            Term frequency score
-        """
-        if document_id not in self.document_keyword_freq:
-            return 0.0
-        
-        freq_map = self.document_keyword_freq[document_id]
-        keyword_freq = freq_map.get(keyword.lower(), 0)
-        
-        if keyword_freq == 0:
-            return 0.0
-        
-        # Normalize by total words in document
-        total_words = sum(freq_map.values())
-        return keyword_freq / total_words if total_words > 0 else 0.0
+    def _intern(self, token: str) -> int:
+        """Return the integer ID for a token, assigning a new one if needed"""
+        token_id = self.token_to_id.get(token)
+        if token_id is None:
+            token_id = len(self.id_to_token)
+            self.token_to_id[token] = token_id
+            self.id_to_token.append(token)
+        return token_id
     
-    def _calculate_recency_score(self, document_id: str) -> float:
-        """
-        Calculate recency score based on last access time.
-        
-        Args:
-            document_id: The document ID
-        
-        Returns:
-            Recency score (0.0 to 1.0)
-        """
-        if document_id not in self.access_history or not self.access_history[document_id]:
-            return 0.0
-        
-        last_access = max(self.access_history[document_id])
-        now = datetime.now()
-        time_diff = (now - last_access).total_seconds()
-        
+    @staticmethod
+    def _recency_from_age(time_diff: float) -> float:
+        """Map seconds since last access to a recency score (0.0 to 1.0)"""
         # Score decays over time (exponential decay)
         # Documents accessed within last hour get high score
         if time_diff < 3600:  # 1 hour
@@ -118,54 +146,32 @@ class SearchEngine:
         else:
             return 0.1
     
-    def _calculate_usage_score(self, document_id: str) -> float:
+    def _count_keywords(self, tokens: List[str]) -> Dict[int, int]:
         """
-        Calculate usage score based on access frequency.
+        Count tokens by interned keyword ID.
         
         Args:
-            document_id: The document ID
+            tokens: Tokens of one document
         
         Returns:
-            Usage score (0.0 to 1.0)
+            HashMap: keyword ID -> number of occurrences
         """
-        if document_id not in self.access_history:
-            return 0.0
-        
-        access_count = len(self.access_history[document_id])
-        
-        # Normalize: more accesses = higher score (capped at 1.0)
-        return min(1.0, access_count / 10.0)
+        keyword_freq = defaultdict(int)
+        for token in tokens:
+            if token not in self.token_to_id:
+                # New vocabulary word: cached short-prefix suggestions may change
+                self._short_prefix_cache.pop(token[:1], None)
+                self._short_prefix_cache.pop(token[:2], None)
+            keyword_freq[self._intern(token)] += 1
+        return keyword_freq
     
-    def _calculate_relevance_score(self, document_id: str, keywords: List[str]) -> float:
-        """
-        Calculate overall relevance score for a document.
-        
-        Ranking factors:
-        1. Keyword frequency (TF) - 50% weight
-        2. Recency of access - 30% weight
-        3. Usage history - 20% weight
-        
-        Args:
-            document_id: The document ID
-            keywords: List of search keywords
-        
-        Returns:
-            Relevance score
-        """
-        # Calculate TF score (average across all keywords)
-        tf_scores = [self._calculate_tf(kw, document_id) for kw in keywords]
-        avg_tf = sum(tf_scores) / len(tf_scores) if tf_scores else 0.0
-        
-        # Calculate recency score
-        recency_score = self._calculate_recency_score(document_id)
-        
-        # Calculate usage score
-        usage_score = self._calculate_usage_score(document_id)
-        
-        # Weighted combination
-        relevance = (0.5 * avg_tf) + (0.3 * recency_score) + (0.2 * usage_score)
-        
-        return relevance
+    def _store_keyword_freq(self, document_id: str, keyword_freq: Dict[int, int], total_words: int) -> None:
+        """Store a document's keyword frequencies, sorted by keyword ID"""
+        token_ids = sorted(keyword_freq)
+        self.document_token_ids[document_id] = array('I', token_ids)
+        self.document_token_freqs[document_id] = array('I', [keyword_freq[t] for t in token_ids])
+        self.document_total_words[document_id] = total_words
+        self._index_version += 1
     
     def index_document(self, document_id: str, title: str, body: str, tags: List[str] = None) -> None:
         """
@@ -189,15 +195,14 @@ class SearchEngine:
         tokens = self._tokenize(full_text)
         
         # Update keyword index and document keyword frequency
-        keyword_freq = defaultdict(int)
-        for token in tokens:
-            self.keyword_index[token].add(document_id)
-            keyword_freq[token] += 1
-            # Add to Trie for autocomplete
-            self.trie.insert(token)
+        keyword_freq = self._count_keywords(tokens)
+        # Add to Trie for autocomplete
+        self.trie.insert_many(tokens)
+        
+        for token_id in keyword_freq:
+            self.keyword_index[token_id].add(document_id)
         
-        # Store keyword frequencies for this document
-        self.document_keyword_freq[document_id] = dict(keyword_freq)
+        self._store_keyword_freq(document_id, keyword_freq, len(tokens))
         
         # Store document metadata
         self.documents[document_id] = {
@@ -213,42 +218,101 @@ class SearchEngine:
             return
         
         # Remove from keyword index
-        if document_id in self.document_keyword_freq:
-            for keyword in self.document_keyword_freq[document_id]:
-                self.keyword_index[keyword].discard(document_id)
-                if not self.keyword_index[keyword]:
-                    del self.keyword_index[keyword]
+        for token_id in self.document_token_ids.get(document_id, ()):
+            self.keyword_index[token_id].discard(document_id)
+            if not self.keyword_index[token_id]:
+                del self.keyword_index[token_id]
         
         # Clean up
         del self.documents[document_id]
-        del self.document_keyword_freq[document_id]
+        self.document_token_ids.pop(document_id, None)
+        self.document_token_freqs.pop(document_id, None)
+        self.document_total_words.pop(document_id, None)
+        self._index_version += 1
         if document_id in self.access_history:
             del self.access_history[document_id]
     
     def update_document(self, document_id: str, title: str = None, body: str = None, tags: List[str] = None) -> bool:
-        """Update an existing document"""
+        """
+        Update an existing document.
+        
+        Only the keywords that appear or disappear are touched in the keyword
+        index and Trie; unchanged keywords and the access history are kept.
+        
+        Time Complexity: O(n) where n is number of words
+        """
         if document_id not in self.documents:
             return False
         
-        # Remove old index
-        self.remove_document(document_id)
-        
         # Get current values
-        current = self.documents.get(document_id, {})
+        current = self.documents[document_id]
         new_title = title if title is not None else current.get("title", "")
         new_body = body if body is not None else current.get("body", "")
         new_tags = tags if tags is not None else current.get("tags", [])
         
-        # Re-index
-        self.index_document(document_id, new_title, new_body, new_tags)
+        tokens = self._tokenize(f"{new_title} {new_body} {' '.join(new_tags)}")
+        keyword_freq = self._count_keywords(tokens)
+        
+        # Apply only the keyword delta
+        old_ids = set(self.document_token_ids.get(document_id, ()))
+        new_ids = keyword_freq.keys()
+        for token_id in old_ids - new_ids:
+            self.keyword_index[token_id].discard(document_id)
+            if not self.keyword_index[token_id]:
+                del self.keyword_index[token_id]
+        for token_id in new_ids - old_ids:
+            self.keyword_index[token_id].add(document_id)
+            self.trie.insert_lower(self.id_to_token[token_id])
+        
+        self._store_keyword_freq(document_id, keyword_freq, len(tokens))
+        
+        self.documents[document_id] = {
+            "id": document_id,
+            "title": new_title,
+            "body": new_body,
+            "tags": new_tags
+        }
         return True
     
     def record_access(self, document_id: str) -> None:
-        """Record that a document was accessed"""
-        self.access_history[document_id].append(datetime.now())
-        # Keep only last 100 accesses per document
-        if len(self.access_history[document_id]) > 100:
-            self.access_history[document_id] = self.access_history[document_id][-100:]
+        """
+        Record that a document was accessed.
+        
+        The event is only queued; it reaches access_history (which keeps the
+        last 100 accesses per document) on the next flush_access_log(), so
+        recency and usage scores may briefly lag behind.
+        """
+        self._access_queue.put_nowait((document_id, time.time()))
+        if self._access_queue.qsize() >= _ACCESS_QUEUE_FLUSH_SIZE:
+            self.flush_access_log()
+    
+    def has_pending_accesses(self) -> bool:
+        """Check whether any access events are waiting for flush_access_log()"""
+        return not self._access_queue.empty()
+    
+    def flush_access_log(self) -> int:
+        """
+        Apply all queued access events to access_history.
+        
+        Returns:
+            Number of events drained from the queue
+        """
+        get_event = self._access_queue.get_nowait
+        access_history = self.access_history
+        documents = self.documents
+        drained = 0
+        
+        while True:
+            try:
+                document_id, timestamp = get_event()
+            except queue.Empty:
+                break
+            drained += 1
+            # Skip documents removed since the access was queued
+            if document_id in documents:
+                access_history[document_id].append(timestamp)
+        
+        return drained
     
     def search(self, query: str, top_k: int = 10) -> List[Dict]:
         """
@@ -261,13 +325,13 @@ class SearchEngine:
         Returns:
             List of ranked document results
         
-        Time Complexity: O(k * log(k)) where k is number of matching documents
+        Time Complexity: O(k * log(t)) where k is number of matching documents, t is top_k
         """
         if not query:
             return []
         
         # Check cache first
-        cache_key = f"search:{query}:{top_k}"
+        cache_key = f"search:{self._index_version}:{query}:{top_k}"
         cached_result = self.search_cache.get(cache_key)
         if cached_result is not None:
             return cached_result
@@ -277,54 +341,136 @@ class SearchEngine:
         if not keywords:
             return []
         
-        # Find documents containing all keywords (AND search)
-        matching_docs = None
-        for keyword in keywords:
-            doc_set = self.keyword_index.get(keyword, set())
-            if matching_docs is None:
-                matching_docs = doc_set.copy()
-            else:
-                matching_docs &= doc_set  # Intersection
+        # Canonical keyword tuple, so queries differing only in case, spacing,
+        # word order or top_k share one ranking pass
+        keywords = sorted(set(keywords))
+        ranked_key = (self._index_version, tuple(keywords), 'AND')
+        cached_ranking = self._ranked_cache.get(ranked_key)
+        if cached_ranking is not None and (cached_ranking[1] or len(cached_ranking[0]) >= top_k):
+            ranked = cached_ranking[0]
+        else:
+            ranked, exhaustive = self._rank(keywords, top_k)
+            self._ranked_cache.put(ranked_key, (ranked, exhaustive))
+        
+        # Materialize the top-k documents, highest score first
+        # (attributes bound to locals once for the loops below)
+        documents = self.documents
+        record_access = self.record_access
+        results = []
+        append_result = results.append
+        for score, doc_id in ranked:
+            if len(results) >= top_k:
+                break
+            doc = documents.get(doc_id)
+            if doc is None:
+                continue
+            doc = doc.copy()
+            doc["relevance_score"] = round(score, 4)
+            append_result(doc)
+        
+        # Record access for the documents actually returned
+        for doc in results:
+            record_access(doc["id"])
+        
+        # Cache the result
+        self.search_cache.put(cache_key, results)
+        
+        return results
+    
+    def _rank(self, keywords: List[str], top_k: int) -> Tuple[List[Tuple[float, str]], bool]:
+        """
+        Rank the top-k documents matching the keywords.
+        
+        Args:
+            keywords: Canonical (deduplicated, sorted) search keywords
+            top_k: Number of top results to keep
+        
+        Returns:
+            Tuple of ([(score, document_id), ...] highest score first, and
+            whether that list covers every matching document)
+        
+        Time Complexity: O(k * log(t)) where k is number of matching documents, t is top_k
+        """
+        # Find documents containing all keywords (AND search), starting from
+        # the smallest posting list so the intersection never walks more than it
+        token_to_id = self.token_to_id
+        posting_lists = [self.keyword_index.get(token_to_id.get(kw), _EMPTY_SET) for kw in keywords]
+        posting_lists.sort(key=len)
+        matching_docs = posting_lists[0].intersection(*posting_lists[1:])
         
         if not matching_docs:
             # If no documents match all keywords, try OR search (any keyword)
-            matching_docs = set()
-            for keyword in keywords:
-                matching_docs |= self.keyword_index.get(keyword, set())
+            matching_docs = set().union(*posting_lists)
+        
+        scored = self._score_documents(matching_docs, keywords)
         
-        # Rank documents using priority queue (min-heap for top-k)
-        # We use negative scores because heapq is a min-heap
-        heap = []
+        # Select top-k (returned highest score first)
+        ranked = heapq.nlargest(top_k, scored)
+        return ranked, len(ranked) == len(scored)
+    
+    def _score_documents(self, document_ids: Set[str], keywords: List[str]) -> List[Tuple[float, str]]:
+        """
+        Score a batch of documents in a single pass.
         
-        for doc_id in matching_docs:
-            if doc_id not in self.documents:
+        Ranking factors:
+        1. Keyword frequency (TF, averaged over keywords) - 50% weight
+        2. Recency of access - 30% weight
+        3. Usage history - 20% weight
+        
+        The clock is read once per batch, and each document's frequency
+        arrays are fetched once with its keyword counts summed before a
+        single normalizing division.
+        
+        Args:
+            document_ids: Candidate document IDs
+            keywords: List of search keywords
+        
+        Returns:
+            List of (score, document_id) tuples (unordered)
+        """
+        documents = self.documents
+        document_token_ids = self.document_token_ids
+        document_token_freqs = self.document_token_freqs
+        document_total_words = self.document_total_words
+        access_history = self.access_history
+        recency_from_age = self._recency_from_age
+        num_keywords = len(keywords)
+        now = time.time()
+        
+        # Resolve keyword IDs once; unknown keywords contribute a TF of 0
+        token_to_id = self.token_to_id
+        keyword_ids = [token_to_id[kw] for kw in keywords if kw in token_to_id]
+        
+        scored = []
+        append_scored = scored.append
+        for doc_id in document_ids:
+            if doc_id not in documents:
                 continue
             
-            score = self._calculate_relevance_score(doc_id, keywords)
+            avg_tf = 0.0
+            token_ids = document_token_ids.get(doc_id)
+            if token_ids and keyword_ids:
+                freqs = document_token_freqs[doc_id]
+                num_tokens = len(token_ids)
+                keyword_count = 0
+                for token_id in keyword_ids:
+                    pos = bisect_left(token_ids, token_id)
+                    if pos < num_tokens and token_ids[pos] == token_id:
+                        keyword_count += freqs[pos]
+                avg_tf = keyword_count / document_total_words[doc_id] / num_keywords
             
-            # Record access for ranking
-            self.record_access(doc_id)
+            history = access_history.get(doc_id)
+            if history:
+                recency_score = recency_from_age(now - history[-1])
+                usage_score = min(1.0, len(history) / _USAGE_SATURATION)
+            else:
+                recency_score = 0.0
+                usage_score = 0.0
             
-            # Use min-heap to keep top-k
-            if len(heap) < top_k:
-                heapq.heappush(heap, (score, doc_id))
-            elif score > heap[0][0]:
-                heapq.heapreplace(heap, (score, doc_id))
-        
-        # Extract results in descending order of score
-        results = []
-        while heap:
-            score, doc_id = heapq.heappop(heap)
-            doc = self.documents[doc_id].copy()
-            doc["relevance_score"] = round(score, 4)
-            results.append(doc)
+            score = (_TF_WEIGHT * avg_tf) + (_RECENCY_WEIGHT * recency_score) + (_USAGE_WEIGHT * usage_score)
+            append_scored((score, doc_id))
         
-        results.reverse()  # Highest score first
-        
-        # Cache the result
-        self.search_cache.put(cache_key, results)
-        
-        return results
+        return scored
     
     def autocomplete(self, prefix: str, limit: int = 10) -> List[str]:
         """
@@ -339,8 +485,27 @@ class SearchEngine:
         
         Time Complexity: O(m + s) where m is prefix length, s is number of suggestions
         """
-        return self.trie.autocomplete(prefix, limit)
+        if not prefix or limit <= 0:
+            return []
+        
+        key = prefix.lower()
+        if len(key) > _SHORT_PREFIX_LEN:
+            return self.trie.autocomplete(key, limit)
+        
+        # Short prefixes walk huge subtrees; reuse the last walk while it
+        # still covers the requested limit (or already found every match)
+        cached = self._short_prefix_cache.get(key)
+        if cached is not None:
+            cached_limit, suggestions = cached
+            if limit <= cached_limit or len(suggestions) < cached_limit:
+                return suggestions[:limit]
+        
+        suggestions = self.trie.autocomplete(key, limit)
+        if suggestions:
+            self._short_prefix_cache[key] = (limit, suggestions)
+        return suggestions[:]
     
     def clear_cache(self) -> None:
-        """Clear the search cache"""
+        """Clear the search caches"""
         self.search_cache.clear()
+        self._ranked_cache.clear()
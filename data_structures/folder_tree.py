@@ -13,27 +13,59 @@ Time Complexity:
 Space Complexity: O(n) where n is number of folders
 """
 
-from typing import Optional, List, Dict, Any
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Tuple, Set, FrozenSet, Union
+
+
+# Maximum number of memoized path normalizations/splits kept per tree
+_PATH_CACHE_SIZE = 4096
+
+# Shared read-only document set for folders that never held a document
+_NO_DOCUMENTS: FrozenSet[str] = frozenset()
 
 
 class FolderNode:
     """Node in the folder tree structure"""
     
-    def __init__(self, name: str, parent: Optional['FolderNode'] = None):
+    __slots__ = ('name', 'parent', 'children', 'document_ids', 'created_at', 'path', '_info')
+    
+    def __init__(self, name: str, parent: Optional['FolderNode'] = None) -> None:
         self.name = name
         self.parent = parent
         self.children: Dict[str, 'FolderNode'] = {}  # HashMap: folder_name -> FolderNode
-        self.document_ids: set = set()  # Set of document IDs in this folder
+        # Set of document IDs in this folder (shared empty sentinel until first add)
+        self.document_ids: Union[Set[str], FrozenSet[str]] = _NO_DOCUMENTS
         self.created_at: Optional[str] = None
+        # Full path, computed once from the parent's (root is "/")
+        self.path: str
+        if parent is None:
+            self.path = "/"
+        elif parent.parent is None:
+            self.path = "/" + name
+        else:
+            self.path = parent.path + "/" + name
+        self._info: Optional[Dict[str, Any]] = None  # Cached info() dict (None = stale)
     
     def get_path(self) -> str:
-        """Get full path of this folder (e.g., '/root/folder1/subfolder')"""
-        path_parts = []
-        node = self
-        while node:
-            path_parts.append(node.name)
-            node = node.parent
-        return '/'.join(reversed(path_parts))
+        """Get full path of this folder (e.g., '/folder1/subfolder')"""
+        return self.path
+    
+    def info(self) -> Dict[str, Any]:
+        """
+        Get folder information (path, name, document and child counts).
+        
+        The dictionary is cached until the folder's children or documents
+        change; callers must not mutate it.
+        """
+        info = self._info
+        if info is None:
+            info = self._info = {
+                "path": self.path,
+                "name": self.name,
+                "document_count": len(self.document_ids),
+                "children_count": len(self.children)
+            }
+        return info
     
     def add_child(self, name: str) -> 'FolderNode':
         """Add a child folder"""
@@ -41,36 +73,73 @@ class FolderNode:
             return self.children[name]
         child = FolderNode(name, self)
         self.children[name] = child
+        self._info = None
         return child
     
     def remove_child(self, name: str) -> bool:
         """Remove a child folder"""
         if name in self.children:
             del self.children[name]
+            self._info = None
             return True
         return False
+    
+    def add_document(self, document_id: str) -> None:
+        """Add a document ID to this folder"""
+        document_ids = self.document_ids
+        if not isinstance(document_ids, set):
+            # First document: replace the shared empty sentinel
+            document_ids = self.document_ids = set()
+        document_ids.add(document_id)
+        self._info = None
+    
+    def remove_document(self, document_id: str) -> None:
+        """Remove a document ID from this folder (no-op if absent)"""
+        if isinstance(self.document_ids, set):
+            self.document_ids.discard(document_id)
+            self._info = None
 
 
 class FolderTree:
     """Tree structure for managing hierarchical folder organization"""
     
-    def __init__(self):
+    def __init__(self) -> None:
         self.root = FolderNode("root")
         self.folders_by_path: Dict[str, FolderNode] = {"/": self.root}  # HashMap for fast lookup
+        # Bounded memo caches (oldest entry evicted first)
+        self._norm_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._split_cache: "OrderedDict[str, Tuple[str, ...]]" = OrderedDict()
     
     def _normalize_path(self, path: str) -> str:
         """Normalize path (remove trailing slashes, handle root)"""
         if not path or path == "/":
             return "/"
-        path = path.strip("/")
-        return "/" + path
+        
+        # Fast path: already normalized
+        if path[0] == "/" and path[-1] != "/" and "//" not in path:
+            return path
+        
+        normalized = self._norm_cache.get(path)
+        if normalized is None:
+            normalized = "/" + path.strip("/")
+            self._norm_cache[path] = normalized
+            if len(self._norm_cache) > _PATH_CACHE_SIZE:
+                self._norm_cache.popitem(last=False)
+        return normalized
     
-    def _split_path(self, path: str) -> List[str]:
+    def _split_path(self, path: str) -> Tuple[str, ...]:
         """Split path into folder names"""
-        normalized = self._normalize_path(path)
-        if normalized == "/":
-            return []
-        return normalized.split("/")[1:]  # Remove leading empty string
+        parts = self._split_cache.get(path)
+        if parts is None:
+            normalized = self._normalize_path(path)
+            if normalized == "/":
+                parts = ()
+            else:
+                parts = tuple(normalized.split("/")[1:])  # Remove leading empty string
+            self._split_cache[path] = parts
+            if len(self._split_cache) > _PATH_CACHE_SIZE:
+                self._split_cache.popitem(last=False)
+        return parts
     
     def add_folder(self, path: str) -> FolderNode:
         """
@@ -82,28 +151,32 @@ class FolderTree:
         Returns:
             The created or existing FolderNode
         
-        Time Complexity: O(h) where h is the depth of the path
+        Time Complexity: O(h) where h is the depth of the path; O(m) when
+        only the last m folders are missing
         """
         normalized_path = self._normalize_path(path)
-        if normalized_path in self.folders_by_path:
-            return self.folders_by_path[normalized_path]
+        existing = self.folders_by_path.get(normalized_path)
+        if existing is not None:
+            return existing
         
         parts = self._split_path(normalized_path)
-        current = self.root
         
-        # Navigate/create path
-        current_path = "/"
-        for part in parts:
-            if current_path == "/":
-                current_path = "/" + part
-            else:
-                current_path = current_path + "/" + part
-            
-            if part in current.children:
-                current = current.children[part]
-            else:
-                current = current.add_child(part)
-                self.folders_by_path[current_path] = current
+        # Find the deepest existing ancestor, walking up from the full path
+        # (the root always exists, so this stops at "/" at the latest)
+        folders_by_path = self.folders_by_path
+        current = None
+        end = len(normalized_path)
+        missing = 0
+        while current is None:
+            end = normalized_path.rfind("/", 0, end)
+            missing += 1
+            ancestor = normalized_path[:end] or "/"
+            current = folders_by_path.get(ancestor)
+        
+        # Create only the missing tail
+        for part in parts[len(parts) - missing:]:
+            current = current.add_child(part)
+            folders_by_path[current.path] = current
         
         return current
     
@@ -146,22 +219,26 @@ class FolderTree:
         if folder.parent:
             folder.parent.remove_child(folder.name)
         
-        # Remove all descendants from folders_by_path using DFS
-        def remove_descendants(node: FolderNode):
-            current_path = node.get_path()
-            if current_path in self.folders_by_path:
-                del self.folders_by_path[current_path]
-            for child in node.children.values():
-                remove_descendants(child)
+        # Collect the subtree's paths using iterative DFS
+        removed_paths: List[str] = []
+        stack = [folder]
+        while stack:
+            node = stack.pop()
+            removed_paths.append(node.path)
+            stack.extend(node.children.values())
+        
+        # Remove all descendants from folders_by_path in one tight loop
+        pop_path = self.folders_by_path.pop
+        for removed_path in removed_paths:
+            pop_path(removed_path, None)
         
-        remove_descendants(folder)
         return True
     
     def add_document_to_folder(self, path: str, document_id: str) -> bool:
         """Add a document ID to a folder"""
         folder = self.get_folder(path)
         if folder:
-            folder.document_ids.add(document_id)
+            folder.add_document(document_id)
             return True
         return False
     
@@ -169,38 +246,43 @@ class FolderTree:
         """Remove a document ID from a folder"""
         folder = self.get_folder(path)
         if folder:
-            folder.document_ids.discard(document_id)
+            folder.remove_document(document_id)
             return True
         return False
     
-    def get_documents_in_folder(self, path: str) -> set:
-        """Get all document IDs in a folder"""
+    def get_documents_in_folder(self, path: str) -> Union[Set[str], FrozenSet[str]]:
+        """
+        Get all document IDs in a folder.
+        
+        Returns the folder's live set itself (no copy, not a read-only view):
+        callers must not mutate it, and must copy it first if documents will
+        be added to or removed from the folder while iterating.
+        """
         folder = self.get_folder(path)
         if folder:
-            return folder.document_ids.copy()
-        return set()
+            return folder.document_ids
+        return _NO_DOCUMENTS
     
-    def traverse_dfs(self, node: Optional[FolderNode] = None, result: List[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    def traverse_dfs(self, node: Optional[FolderNode] = None) -> List[Dict[str, Any]]:
         """
-        DFS traversal of the folder tree.
+        DFS (pre-order) traversal of the folder tree, using an explicit stack.
+        
+        Args:
+            node: Subtree root to start from (default: tree root)
         
         Returns:
-            List of folder information dictionaries
+            List of folder information dictionaries (cached per node; do not
+            mutate)
         """
-        if result is None:
-            result = []
-        if node is None:
-            node = self.root
-        
-        result.append({
-            "path": node.get_path(),
-            "name": node.name,
-            "document_count": len(node.document_ids),
-            "children_count": len(node.children)
-        })
+        result = []
+        stack = [node if node is not None else self.root]
         
-        for child in node.children.values():
-            self.traverse_dfs(child, result)
+        while stack:
+            node = stack.pop()
+            result.append(node.info())
+            
+            # Push children reversed so they are visited in insertion order
+            stack.extend(reversed(node.children.values()))
         
         return result
     
@@ -209,7 +291,8 @@ class FolderTree:
         BFS traversal of the folder tree.
         
         Returns:
-            List of folder information dictionaries
+            List of folder information dictionaries (cached per node; do not
+            mutate)
         """
         from collections import deque
         
@@ -218,12 +301,7 @@ class FolderTree:
         
         while queue:
             node = queue.popleft()
-            result.append({
-                "path": node.get_path(),
-                "name": node.name,
-                "document_count": len(node.document_ids),
-                "children_count": len(node.children)
-            })
+            result.append(node.info())
             
             for child in node.children.values():
                 queue.append(child)
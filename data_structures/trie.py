@@ -9,23 +9,47 @@ Time Complexity:
 Space Complexity: O(ALPHABET_SIZE * N * M) where N is number of words, M is average length
 """
 
+import sys
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+
+# Shared read-only children map for nodes without children (most leaves);
+# replaced by a real dict when the first child is added
+_NO_CHILDREN: Mapping[str, 'TrieNode'] = MappingProxyType({})
+
 
 class TrieNode:
     """Node in the Trie data structure"""
     
-    def __init__(self):
-        self.children = {}  # HashMap: char -> TrieNode
-        self.is_end_of_word = False
-        self.word_count = 0  # Number of words ending at this node
-        self.words = []  # Store actual words for autocomplete suggestions
+    __slots__ = ('children', 'is_end_of_word', 'word_count', 'words', '_sorted_children')
+    
+    def __init__(self) -> None:
+        self.children: Mapping[str, 'TrieNode'] = _NO_CHILDREN  # HashMap: char -> TrieNode
+        self.is_end_of_word: bool = False
+        self.word_count: int = 0  # Number of words ending at this node
+        # Actual words for autocomplete (allocated on first end-of-word)
+        self.words: Optional[List[str]] = None
+        # Cached child nodes in reverse char order, ready to push on a DFS
+        # stack (None = stale)
+        self._sorted_children: Optional[Tuple['TrieNode', ...]] = None
+    
+    def _add_child(self, char: str) -> 'TrieNode':
+        """Create and attach a child for char, allocating the children dict on first use"""
+        children = self.children
+        if not isinstance(children, dict):
+            children = self.children = {}
+        child = children[char] = TrieNode()
+        self._sorted_children = None
+        return child
 
 
 class Trie:
     """Trie implementation for efficient prefix search and autocomplete"""
     
-    def __init__(self):
+    def __init__(self) -> None:
         self.root = TrieNode()
-        self.total_words = 0
+        self.total_words: int = 0
     
     def insert(self, word: str) -> None:
         """
@@ -34,26 +58,91 @@ class Trie:
         Args:
             word: The word to insert (case-insensitive)
         
+        Time Complexity: O(m) where m is the length of the word
+        """
+        if word and not word.islower():
+            word = word.lower()
+        self.insert_lower(word)
+    
+    def insert_lower(self, word: str) -> None:
+        """
+        Insert a word the caller guarantees is already lowercase.
+        
+        Same as insert() without the case check, so no lowered copy of the
+        word is created (e.g. for tokens that were lowercased during
+        tokenization).
+        
+        Args:
+            word: The lowercase word to insert
+        
         Time Complexity: O(m) where m is the length of the word
         """
         if not word:
             return
         
-        word = word.lower()
         node = self.root
         
         for char in word:
-            if char not in node.children:
-                node.children[char] = TrieNode()
-            node = node.children[char]
+            child = node.children.get(char)
+            if child is None:
+                child = node._add_child(char)
+            node = child
         
+        self._mark_word(node, word, 1)
+    
+    def insert_many(self, words: Iterable[str]) -> None:
+        """
+        Insert many words into the Trie.
+        
+        Equivalent to calling insert() for each word, but words are inserted
+        in sorted order and each walk resumes from the deepest node shared
+        with the previous word instead of the root.
+        
+        Args:
+            words: The words to insert (case-insensitive)
+        
+        Time Complexity: O(N * (m - p)) where N is number of distinct words,
+        m is average length, p is average prefix shared with the previous word
+        """
+        # Count occurrences so word_count matches repeated insert() calls
+        counts: Dict[str, int] = {}
+        for word in words:
+            if word:
+                if not word.islower():
+                    word = word.lower()
+                counts[word] = counts.get(word, 0) + 1
+        
+        path: List[TrieNode] = [self.root]  # path[i] is the node reached by prev[:i]
+        prev = ""
+        for word in sorted(counts):
+            common = 0
+            max_common = min(len(prev), len(word))
+            while common < max_common and prev[common] == word[common]:
+                common += 1
+            del path[common + 1:]
+            prev = word
+            
+            node = path[-1]
+            for char in word[common:]:
+                child = node.children.get(char)
+                if child is None:
+                    child = node._add_child(char)
+                node = child
+                path.append(node)
+            
+            self._mark_word(node, word, counts[word])
+    
+    def _mark_word(self, node: TrieNode, word: str, count: int) -> None:
+        """Mark node as the end of word, inserted count times"""
         if not node.is_end_of_word:
             node.is_end_of_word = True
             self.total_words += 1
         
-        node.word_count += 1
-        if word not in node.words:
-            node.words.append(word)
+        node.word_count += count
+        # A node is reached only by spelling its word, so it stores exactly one
+        # word; no membership scan is needed
+        if node.words is None:
+            node.words = [word]
     
     def search(self, word: str) -> bool:
         """
@@ -70,7 +159,8 @@ class Trie:
         if not word:
             return False
         
-        word = word.lower()
+        if not word.islower():
+            word = word.lower()
         node = self.root
         
         for char in word:
@@ -80,32 +170,43 @@ class Trie:
         
         return node.is_end_of_word
     
-    def _dfs_collect_words(self, node: TrieNode, prefix: str, results: list, limit: int) -> None:
+    def _dfs_collect_words(self, node: TrieNode, prefix: str, results: List[str], limit: int) -> None:
         """
         DFS traversal to collect all words with given prefix.
         
+        Iterative (explicit stack), visiting children in sorted order; a set
+        alongside results makes duplicate checks O(1).
+        
         Args:
             node: Current Trie node
             prefix: Current prefix string
             results: List to store results
             limit: Maximum number of results to collect
         """
-        if len(results) >= limit:
-            return
-        
-        if node.is_end_of_word:
-            for word in node.words:
-                if word not in results:
-                    results.append(word)
-                if len(results) >= limit:
-                    return
-        
-        for char, child_node in sorted(node.children.items()):
-            if len(results) >= limit:
-                break
-            self._dfs_collect_words(child_node, prefix + char, results, limit)
+        seen = set(results)
+        stack = [node]
+        
+        while stack and len(results) < limit:
+            node = stack.pop()
+            
+            if node.is_end_of_word and node.words is not None:
+                for word in node.words:
+                    if word not in seen:
+                        seen.add(word)
+                        results.append(word)
+                    if len(results) >= limit:
+                        return
+            
+            # Children are cached in reverse order so the smallest is popped first
+            sorted_children = node._sorted_children
+            if sorted_children is None:
+                children = node.children
+                sorted_children = node._sorted_children = tuple(
+                    children[char] for char in sorted(children, reverse=True)
+                )
+            stack.extend(sorted_children)
     
-    def autocomplete(self, prefix: str, limit: int = 10) -> list:
+    def autocomplete(self, prefix: str, limit: int = 10) -> List[str]:
         """
         Get autocomplete suggestions for a given prefix.
         
@@ -121,7 +222,8 @@ class Trie:
         if not prefix:
             return []
         
-        prefix = prefix.lower()
+        if not prefix.islower():
+            prefix = prefix.lower()
         node = self.root
         
         # Navigate to the prefix node
@@ -131,13 +233,13 @@ class Trie:
             node = node.children[char]
         
         # Collect all words with this prefix using DFS
-        results = []
+        results: List[str] = []
         self._dfs_collect_words(node, prefix, results, limit)
         
         return results
     
-    def get_all_words(self) -> list:
+    def get_all_words(self) -> List[str]:
         """Get all words stored in the Trie"""
-        results = []
-        self._dfs_collect_words(self.root, "", results, float('inf'))
+        results: List[str] = []
+        self._dfs_collect_words(self.root, "", results, sys.maxsize)
         return results
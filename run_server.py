@@ -11,18 +11,29 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'api'))
 
 if __name__ == "__main__":
+    dev_mode = os.environ.get("SMARTSEARCH_DEV") == "1"
+    
     print("=" * 60)
     print("Personal Smart Search & Organizer System")
     print("=" * 60)
     print("\nStarting FastAPI server...")
     print("API will be available at: http://localhost:8000")
     print("API Documentation: http://localhost:8000/docs")
+    print(f"Auto-reload: {'on' if dev_mode else 'off (set SMARTSEARCH_DEV=1 to enable)'}")
     print("\nPress Ctrl+C to stop the server\n")
     print("=" * 60)
     
+    # Auto-reload on code changes only in development (SMARTSEARCH_DEV=1);
+    # the reloader spawns a file watcher and supervisor process.
+    # A single worker is used either way: documents and the search index live
+    # in process memory, so extra workers would each see a different dataset.
+    # "auto" picks uvloop/httptools when installed (uvloop is not available
+    # on Windows) and falls back to asyncio/h11 otherwise.
     uvicorn.run(
         "api.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True  # Auto-reload on code changes
+        reload=dev_mode,
+        loop="auto",
+        http="auto"
     )